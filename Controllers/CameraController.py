@@ -18,6 +18,15 @@ if __name__ == "__main__":
     else:
         print("Frame was not captured")
 
+    # Run with --benchmark to measure the memory each capture allocates
+    if "--benchmark" in sys.argv:
+        benchmark = camera_service.benchmark_capture(frames=100)
+        if benchmark is not None:
+            print(f"Capture benchmark over {benchmark['frames']} frames: "
+                  f"{benchmark['avg_peak_growth_bytes']:.0f} bytes average peak growth per frame, "
+                  f"{benchmark['max_peak_growth_bytes']} bytes max, "
+                  f"{benchmark['retained_blocks']} blocks retained")
+
     camera_service.record_video("test_video.mp4", duration=5)
 
     camera_service.release()
\ No newline at end of file
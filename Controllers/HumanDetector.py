@@ -4,7 +4,9 @@ import numpy as np
 import mediapipe as mp
 import sys
 import os
+import tracemalloc
 from collections import deque
+from math import hypot, inf
 from time import time
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -37,16 +39,43 @@ def send_alert(msg, command):
         last_alert = msg
         last_time = now
 
+def mean_step(q):
+    """Average distance between consecutive points in q, without building temporary lists."""
+    total = 0.0
+    prev = None
+    for point in q:
+        if prev is not None:
+            total += hypot(point[0] - prev[0], point[1] - prev[1])
+        prev = point
+    return total / (len(q) - 1)
+
+# Run with --benchmark to report how far memory peaks rise within each frame of the loop
+benchmark = "--benchmark" in sys.argv
+benchmark_frames = 0
+benchmark_growth = 0
+if benchmark:
+    tracemalloc.start()
+
 # Replace this with your actual camera or use OpenCV VideoCapture for quick test
 cap = cv2.VideoCapture(0)
 
+# Reusable frame buffers: cap.read and cvtColor write into these instead of allocating every frame
+frame = None
+rgb = None
+
 while True:
-    ret, frame = cap.read()
+    if benchmark:
+        tracemalloc.reset_peak()
+        frame_start, _ = tracemalloc.get_traced_memory()
+
+    ret, frame = cap.read(frame)
     if not ret:
         break
 
     h, w, _ = frame.shape
-    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    if rgb is None or rgb.shape != frame.shape:
+        rgb = np.empty_like(frame)
+    cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb)
 
     pose_result = pose.process(rgb)
     face_result = face.process(rgb)
@@ -58,10 +87,11 @@ while True:
         lms = pose_result.pose_landmarks.landmark
 
         # Draw green bounding box around person
-        xs = [lm.x for lm in lms]
-        ys = [lm.y for lm in lms]
-        min_x, max_x = min(xs), max(xs)
-        min_y, max_y = min(ys), max(ys)
+        min_x = min_y = inf
+        max_x = max_y = -inf
+        for lm in lms:
+            min_x, max_x = min(min_x, lm.x), max(max_x, lm.x)
+            min_y, max_y = min(min_y, lm.y), max(max_y, lm.y)
 
         start_point = (int(min_x * w), int(min_y * h))
         end_point = (int(max_x * w), int(max_y * h))
@@ -72,8 +102,7 @@ while True:
         rw = lms[mp_pose.PoseLandmark.RIGHT_WRIST]
         hand_q.append((rw.x, rw.y))
         if len(hand_q) > 5:
-            deltas = [np.linalg.norm(np.subtract(hand_q[i], hand_q[i-1])) for i in range(1, len(hand_q))]
-            if np.mean(deltas) > 0.01:
+            if mean_step(hand_q) > 0.01:
                 command = "FIDGETING_HANDS"
                 alert = "Stop fidgeting hands"
 
@@ -83,8 +112,7 @@ while True:
         hips = ((lhip.x + rhip.x)/2, (lhip.y + rhip.y)/2)
         hip_q.append(hips)
         if len(hip_q) > 5:
-            deltas = [np.linalg.norm(np.subtract(hip_q[i], hip_q[i-1])) for i in range(1, len(hip_q))]
-            if np.mean(deltas) > 0.005:
+            if mean_step(hip_q) > 0.005:
                 command = "STOP_SWAYING"
                 alert = "Stop swaying"
 
@@ -96,8 +124,7 @@ while True:
             legs = ((lankle.x + rankle.x)/2, (lankle.y + rankle.y)/2)
             leg_q.append(legs)
             if len(leg_q) > 5:
-                deltas = [np.linalg.norm(np.subtract(leg_q[i], leg_q[i-1])) for i in range(1, len(leg_q))]
-                if np.mean(deltas) > 0.005:
+                if mean_step(leg_q) > 0.005:
                     command = "SWINGING_LEGS"
                     alert = "Stop swinging legs"
         else:
@@ -109,8 +136,7 @@ while True:
             head_q.append((nose.x, nose.y))
 
             if len(head_q) > 5:
-                deltas = [np.linalg.norm(np.subtract(head_q[i], head_q[i - 1])) for i in range(1, len(head_q))]
-                movement = np.mean(deltas)
+                movement = mean_step(head_q)
 
                 if movement < 0.003:
                     if still_start_time is None:
@@ -125,6 +151,13 @@ while True:
     if alert and command:
         send_alert(alert, command)
 
+    if benchmark:
+        _, frame_peak = tracemalloc.get_traced_memory()
+        benchmark_frames += 1
+        benchmark_growth += frame_peak - frame_start
+        if benchmark_frames % 100 == 0:
+            print(f"[BENCHMARK] {benchmark_growth / benchmark_frames:.0f} bytes average peak growth per frame over {benchmark_frames} frames")
+
     cv2.imshow("Pose Detection", frame)
     if cv2.waitKey(1) & 0xFF == ord('q'):
         break